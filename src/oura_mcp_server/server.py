@@ -2,32 +2,181 @@
 
 import os
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, List
-
-import requests
+import functools
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Literal, Optional, Tuple, get_args
+
+import httpx
+import ijson
+import orjson
+from cachetools import TTLCache
+from ijson.common import ObjectBuilder
 from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
-from mcp.types import Resource, Tool, TextContent
-from pydantic import BaseModel, Field
-
-load_dotenv()
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.types import TextContent
+
+# .env is only consulted when the token isn't already in the environment
+if "OURA_ACCESS_TOKEN" not in os.environ:
+    load_dotenv()
+
+# Status codes worth retrying with exponential backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+# Longest Retry-After wait honoured before retrying
+RETRY_AFTER_CAP = 30.0
+
+# Number of prefetched pagination pages kept in memory
+PREFETCH_CACHE_SIZE = 8
+
+# Responses are reused for 15 minutes; Oura data rarely changes faster than that
+CACHE_MAXSIZE = 64
+CACHE_TTL = 900
+
+# Oura usercollection endpoints; requests address them by index into this tuple
+ENDPOINTS = (
+    "session",
+    "daily_activity",
+    "daily_sleep",
+    "daily_spo2",
+    "daily_readiness",
+    "sleep",
+    "sleep_time",
+    "workout",
+    "enhanced_tag",
+    "personal_info",
+)
+(
+    SESSION,
+    DAILY_ACTIVITY,
+    DAILY_SLEEP,
+    DAILY_SPO2,
+    DAILY_READINESS,
+    SLEEP,
+    SLEEP_TIME,
+    WORKOUT,
+    ENHANCED_TAG,
+    PERSONAL_INFO,
+) = range(len(ENDPOINTS))
+# Endpoints that hold date-ranged records; tools taking one publish these names as an enum
+RecordEndpoint = Literal[
+    "session",
+    "daily_activity",
+    "daily_sleep",
+    "daily_spo2",
+    "daily_readiness",
+    "sleep",
+    "sleep_time",
+    "workout",
+    "enhanced_tag",
+]
+RECORD_ENDPOINTS = {name: ENDPOINTS.index(name) for name in get_args(RecordEndpoint)}
+
+# The recent resources are re-fetched in the background well within CACHE_TTL
+RECENT_REFRESH_INTERVAL = 600
+RECENT_ENDPOINTS = (SESSION, DAILY_ACTIVITY, DAILY_SLEEP, DAILY_READINESS)
+
+# Records per text block returned by the JSON Lines tool
+JSONL_BATCH_SIZE = 16
+
+# Dates are checked locally so malformed input never costs an API round-trip
+DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# Tool errors are returned as JSON; error bodies from the API are truncated to this many bytes
+ERROR_BODY_LIMIT = 512
+INVALID_DATE_ERROR = orjson.dumps({
+    "error": "invalid_date",
+    "message": "start_date and end_date must be in YYYY-MM-DD format",
+}).decode()
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, preferring the server's Retry-After."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), RETRY_AFTER_CAP)
+    return BACKOFF_FACTOR * 2 ** attempt
 
 
 class OuraRingAPI:
     """Oura Ring API client."""
     
-    def __init__(self, access_token: str):
-        self.access_token = access_token
+    def __init__(self, access_token: str, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.base_url = "https://api.ouraring.com/v2"
-        self.headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
-    
-    def _make_request(self, endpoint: str, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
-        """Make a request to the Oura Ring API."""
-        url = f"{self.base_url}/{endpoint}"
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=MAX_RETRIES,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            )
+        # One HTTP/2 connection pool shared by every in-flight request; headers are set once here
+        self._client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, br",
+            },
+            # Bounded at every stage so a stalled connection can't wedge a tool call
+            timeout=httpx.Timeout(connect=3.0, read=30.0, write=10.0, pool=5.0),
+            transport=transport,
+        )
+        # Absolute endpoint URLs indexed like ENDPOINTS, built once so requests skip joining them onto base_url
+        self._urls = tuple(httpx.URL(f"{self.base_url}/usercollection/{name}") for name in ENDPOINTS)
+        # Next pages fetched in the background, keyed by (endpoint, start_date, end_date, next_token)
+        self._prefetch: OrderedDict[Tuple[int, str, str, str], asyncio.Task] = OrderedDict()
+        # Parsed responses, keyed like the prefetch map (personal info uses its endpoint alone)
+        self._cache: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+    
+    def cache_clear(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+    
+    async def aclose(self) -> None:
+        """Cancel pending prefetches and close the underlying HTTP client."""
+        for task in self._prefetch.values():
+            task.cancel()
+        self._prefetch.clear()
+        await self._client.aclose()
+    
+    async def _get(self, endpoint: int, params: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """GET an endpoint, retrying rate-limited and transient server errors."""
+        for attempt in range(MAX_RETRIES + 1):
+            response = await self._client.get(self._urls[endpoint], params=params)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+        response.raise_for_status()
+        return response
+    
+    @asynccontextmanager
+    async def _stream(self, endpoint: int, params: Dict[str, str]) -> AsyncIterator[httpx.Response]:
+        """Open a streamed GET with the same retry policy as _get()."""
+        for attempt in range(MAX_RETRIES + 1):
+            async with self._client.stream("GET", self._urls[endpoint], params=params) as response:
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    if response.is_error:
+                        await response.aread()
+                        response.raise_for_status()
+                    yield response
+                    return
+                delay = _retry_delay(response, attempt)
+            await asyncio.sleep(delay)
+    
+    async def _fetch_page(self, endpoint: int, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch a single page from the Oura Ring API."""
         params = {
             "start_date": start_date,
             "end_date": end_date
@@ -36,56 +185,171 @@ class OuraRingAPI:
         if next_token:
             params["next_token"] = next_token
             
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        response = await self._get(endpoint, params)
+        return orjson.loads(response.content)
+    
+    def _schedule_prefetch(self, endpoint: int, start_date: str, end_date: str, next_token: Optional[str]) -> None:
+        """Start fetching the page behind next_token in the background."""
+        key = (endpoint, start_date, end_date, next_token)
+        if not next_token or key in self._prefetch or key in self._cache:
+            return
+        
+        task = asyncio.create_task(self._fetch_page(endpoint, start_date, end_date, next_token))
+        # Failures are re-raised when the page is requested; don't log them as unretrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._prefetch[key] = task
+        while len(self._prefetch) > PREFETCH_CACHE_SIZE:
+            _, evicted = self._prefetch.popitem(last=False)
+            evicted.cancel()
+    
+    async def fetch(self, endpoint: int, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch a page from an ENDPOINTS index, serving cached or prefetched pages when available."""
+        key = (endpoint, start_date, end_date, next_token)
+        data = self._cache.get(key)
+        if data is None:
+            task = self._prefetch.pop(key, None) if next_token else None
+            if task is not None:
+                try:
+                    # Shielded so cancelling this caller leaves the shared prefetch running
+                    data = await asyncio.shield(task)
+                except asyncio.CancelledError:
+                    if asyncio.current_task().cancelling() or not task.cancelled():
+                        # The caller was cancelled; keep the page for the next request
+                        if not task.done():
+                            self._prefetch[key] = task
+                        raise
+                    # The prefetch itself was cancelled (evicted), so fetch the page now
+                    data = await self._fetch_page(endpoint, start_date, end_date, next_token)
+                except httpx.HTTPError:
+                    data = await self._fetch_page(endpoint, start_date, end_date, next_token)
+            else:
+                data = await self._fetch_page(endpoint, start_date, end_date, next_token)
+            self._cache[key] = data
+        
+        # Keep one page ahead so a follow-up call with next_token returns from memory
+        self._schedule_prefetch(endpoint, start_date, end_date, data.get("next_token"))
+        return data
+    
+    async def refresh(self, endpoint: int, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Re-fetch the first page of a date range, replacing any cached copy."""
+        data = await self._fetch_page(endpoint, start_date, end_date)
+        self._cache[(endpoint, start_date, end_date, None)] = data
+        return data
+    
+    async def iter_records(self, endpoint: int, start_date: str, end_date: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every record in a date range, following pagination.
+        
+        Records are parsed incrementally as the body arrives, so only one
+        record is held in memory at a time instead of the whole page.
+        """
+        next_token = None
+        while True:
+            params = {
+                "start_date": start_date,
+                "end_date": end_date
+            }
+            if next_token:
+                params["next_token"] = next_token
+            
+            events = ijson.sendable_list()
+            # Floats rather than Decimal, matching what orjson.loads returns elsewhere
+            parser = ijson.parse_coro(events, use_float=True)
+            builder = None
+            next_token = None
+            async with self._stream(endpoint, params) as response:
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for prefix, event, value in events:
+                        if prefix == "data.item" and event == "start_map":
+                            builder = ObjectBuilder()
+                        if builder is not None:
+                            builder.event(event, value)
+                            if prefix == "data.item" and event == "end_map":
+                                yield builder.value
+                                builder = None
+                        elif prefix == "next_token" and event == "string":
+                            next_token = value
+                    del events[:]
+            parser.close()
+            
+            if not next_token:
+                return
     
-    def get_personal_info(self) -> Dict[str, Any]:
+    async def get_personal_info(self) -> Dict[str, Any]:
         """Get personal info from Oura Ring API."""
-        url = f"{self.base_url}/usercollection/personal_info"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    
-    def get_sessions(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+        key = (PERSONAL_INFO,)
+        info = self._cache.get(key)
+        if info is None:
+            response = await self._get(PERSONAL_INFO)
+            info = self._cache[key] = orjson.loads(response.content)
+        return info
+    
+    async def get_sessions(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get session data from Oura Ring API."""
-        return self._make_request("usercollection/session", start_date, end_date, next_token)
+        return await self.fetch(SESSION, start_date, end_date, next_token)
     
-    def get_daily_activity(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+    async def get_daily_activity(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get daily activity data from Oura Ring API."""
-        return self._make_request("usercollection/daily_activity", start_date, end_date, next_token)
+        return await self.fetch(DAILY_ACTIVITY, start_date, end_date, next_token)
     
-    def get_daily_sleep(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+    async def get_daily_sleep(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get daily sleep data from Oura Ring API."""
-        return self._make_request("usercollection/daily_sleep", start_date, end_date, next_token)
+        return await self.fetch(DAILY_SLEEP, start_date, end_date, next_token)
     
-    def get_daily_spo2(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+    async def get_daily_spo2(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get daily SpO2 data from Oura Ring API."""
-        return self._make_request("usercollection/daily_spo2", start_date, end_date, next_token)
+        return await self.fetch(DAILY_SPO2, start_date, end_date, next_token)
     
-    def get_daily_readiness(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+    async def get_daily_readiness(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get daily readiness data from Oura Ring API."""
-        return self._make_request("usercollection/daily_readiness", start_date, end_date, next_token)
+        return await self.fetch(DAILY_READINESS, start_date, end_date, next_token)
     
-    def get_sleep(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+    async def get_sleep(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get sleep data from Oura Ring API."""
-        return self._make_request("usercollection/sleep", start_date, end_date, next_token)
+        return await self.fetch(SLEEP, start_date, end_date, next_token)
     
-    def get_sleep_time(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+    async def get_sleep_time(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get sleep time data from Oura Ring API."""
-        return self._make_request("usercollection/sleep_time", start_date, end_date, next_token)
+        return await self.fetch(SLEEP_TIME, start_date, end_date, next_token)
     
-    def get_workout(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+    async def get_workout(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get workout data from Oura Ring API."""
-        return self._make_request("usercollection/workout", start_date, end_date, next_token)
+        return await self.fetch(WORKOUT, start_date, end_date, next_token)
     
-    def get_enhanced_tag(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
+    async def get_enhanced_tag(self, start_date: str, end_date: str, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Get enhanced tag data from Oura Ring API."""
-        return self._make_request("usercollection/enhanced_tag", start_date, end_date, next_token)
+        return await self.fetch(ENHANCED_TAG, start_date, end_date, next_token)
+
+
+# The single background refresher for this process, started by the first session
+_refresher: Optional[asyncio.Task] = None
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Make sure the process-wide recent-data refresher is running.
+    
+    FastMCP enters this once per session (per connection for SSE and HTTP).
+    Sessions share one refresher and one API client, which are both torn
+    down once when the process exits (see _shutdown).
+    """
+    global _refresher
+    if _refresher is None or _refresher.done() or _refresher.get_loop() is not asyncio.get_running_loop():
+        _refresher = asyncio.create_task(_recent_refresher())
+    yield
+
+
+async def _shutdown() -> None:
+    """Stop the refresher and close the shared API client."""
+    if _refresher is not None and not _refresher.done():
+        _refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await _refresher
+    await oura_api.aclose()
 
 
 # Initialize FastMCP server
-mcp = FastMCP("Oura Ring MCP Server")
+mcp = FastMCP("Oura Ring MCP Server", lifespan=lifespan)
 
 # Initialize Oura Ring API client
 oura_token = os.getenv("OURA_ACCESS_TOKEN")
@@ -95,225 +359,148 @@ if not oura_token:
 oura_api = OuraRingAPI(oura_token)
 
 
+@functools.lru_cache(maxsize=1)
+def _recent_range(epoch_minute: int) -> Tuple[str, str]:
+    """Return the (start_date, end_date) of the last 7 days, memoized per minute."""
+    today = date.today()
+    return (today - timedelta(days=7)).isoformat(), today.isoformat()
+
+
+async def _recent_refresher() -> None:
+    """Periodically refresh the recent endpoints so resource reads are served from the cache."""
+    while True:
+        start_date, end_date = _recent_range(int(time.time()) // 60)
+        # Failures are left to the resource handlers, which fetch on demand and report them
+        await asyncio.gather(
+            *(oura_api.refresh(endpoint, start_date, end_date) for endpoint in RECENT_ENDPOINTS),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(RECENT_REFRESH_INTERVAL)
+
+
 # Resources
 @mcp.resource("oura://personal_info")
-def get_personal_info_resource() -> str:
+async def get_personal_info_resource() -> str:
     """Get personal info from Oura Ring."""
     try:
-        info = oura_api.get_personal_info()
-        return f"Personal Info:\n\n{info}"
+        info = await oura_api.get_personal_info()
+        return f"Personal Info:\n\n{orjson.dumps(info).decode()}"
     except Exception as e:
         return f"Error fetching personal info: {str(e)}"
 
 
 @mcp.resource("oura://sessions/recent")
-def get_recent_sessions() -> str:
+async def get_recent_sessions() -> str:
     """Get recent session data from the last 7 days."""
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    start_date, end_date = _recent_range(int(time.time()) // 60)
     
     try:
-        sessions = oura_api.get_sessions(start_date, end_date)
-        return f"Recent Sessions ({start_date} to {end_date}):\n\n{sessions}"
+        sessions = await oura_api.get_sessions(start_date, end_date)
+        return f"Recent Sessions ({start_date} to {end_date}):\n\n{orjson.dumps(sessions).decode()}"
     except Exception as e:
         return f"Error fetching recent sessions: {str(e)}"
 
 
 @mcp.resource("oura://activity/recent")
-def get_recent_activity() -> str:
+async def get_recent_activity() -> str:
     """Get recent daily activity data from the last 7 days."""
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    start_date, end_date = _recent_range(int(time.time()) // 60)
     
     try:
-        activity = oura_api.get_daily_activity(start_date, end_date)
-        return f"Recent Daily Activity ({start_date} to {end_date}):\n\n{activity}"
+        activity = await oura_api.get_daily_activity(start_date, end_date)
+        return f"Recent Daily Activity ({start_date} to {end_date}):\n\n{orjson.dumps(activity).decode()}"
     except Exception as e:
         return f"Error fetching recent activity: {str(e)}"
 
 
 @mcp.resource("oura://sleep/recent")
-def get_recent_sleep() -> str:
+async def get_recent_sleep() -> str:
     """Get recent daily sleep data from the last 7 days."""
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    start_date, end_date = _recent_range(int(time.time()) // 60)
     
     try:
-        sleep = oura_api.get_daily_sleep(start_date, end_date)
-        return f"Recent Daily Sleep ({start_date} to {end_date}):\n\n{sleep}"
+        sleep = await oura_api.get_daily_sleep(start_date, end_date)
+        return f"Recent Daily Sleep ({start_date} to {end_date}):\n\n{orjson.dumps(sleep).decode()}"
     except Exception as e:
         return f"Error fetching recent sleep: {str(e)}"
 
 
 @mcp.resource("oura://readiness/recent")
-def get_recent_readiness() -> str:
+async def get_recent_readiness() -> str:
     """Get recent daily readiness data from the last 7 days."""
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    start_date, end_date = _recent_range(int(time.time()) // 60)
     
     try:
-        readiness = oura_api.get_daily_readiness(start_date, end_date)
-        return f"Recent Daily Readiness ({start_date} to {end_date}):\n\n{readiness}"
+        readiness = await oura_api.get_daily_readiness(start_date, end_date)
+        return f"Recent Daily Readiness ({start_date} to {end_date}):\n\n{orjson.dumps(readiness).decode()}"
     except Exception as e:
         return f"Error fetching recent readiness: {str(e)}"
 
 
-# Tools
-@mcp.tool()
-def get_oura_personal_info() -> str:
-    """
-    Get personal info from Oura Ring.
-    
-    Returns:
-        JSON string containing personal information
-    """
-    try:
-        info = oura_api.get_personal_info()
-        return str(info)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool()
-def get_oura_sessions(
-    start_date: str,
-    end_date: str,
-    next_token: Optional[str] = None
-) -> str:
-    """
-    Get Oura Ring session data for a specific date range.
+@mcp.resource("oura://recent")
+async def get_all_recent() -> str:
+    """Get recent sessions, activity, sleep and readiness data from the last 7 days."""
+    start_date, end_date = _recent_range(int(time.time()) // 60)
     
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format  
-        next_token: Optional pagination token for getting more results
+    # The four endpoints are independent, so fetch them concurrently
+    results = await asyncio.gather(
+        oura_api.get_sessions(start_date, end_date),
+        oura_api.get_daily_activity(start_date, end_date),
+        oura_api.get_daily_sleep(start_date, end_date),
+        oura_api.get_daily_readiness(start_date, end_date),
+        return_exceptions=True,
+    )
     
-    Returns:
-        JSON string containing session data
-    """
-    try:
-        sessions = oura_api.get_sessions(start_date, end_date, next_token)
-        return str(sessions)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    sections = []
+    for title, result in zip(("Sessions", "Daily Activity", "Daily Sleep", "Daily Readiness"), results):
+        if isinstance(result, Exception):
+            sections.append(f"Error fetching recent {title.lower()}: {str(result)}")
+        else:
+            sections.append(f"Recent {title} ({start_date} to {end_date}):\n\n{orjson.dumps(result).decode()}")
+    return "\n\n".join(sections)
 
 
-@mcp.tool()
-def get_oura_daily_activity(
-    start_date: str,
-    end_date: str,
-    next_token: Optional[str] = None
-) -> str:
-    """
-    Get Oura Ring daily activity data for a specific date range.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format  
-        next_token: Optional pagination token for getting more results
-    
-    Returns:
-        JSON string containing daily activity data
-    """
-    try:
-        activity = oura_api.get_daily_activity(start_date, end_date, next_token)
-        return str(activity)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+def _http_error(e: httpx.HTTPStatusError) -> str:
+    """Describe an API error response as JSON, keeping only the start of its body."""
+    return orjson.dumps({
+        "error": "http",
+        "status": e.response.status_code,
+        "body": e.response.content[:ERROR_BODY_LIMIT].decode("utf-8", "replace"),
+    }).decode()
 
 
-@mcp.tool()
-def get_oura_daily_sleep(
-    start_date: str,
-    end_date: str,
-    next_token: Optional[str] = None
-) -> str:
-    """
-    Get Oura Ring daily sleep data for a specific date range.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format  
-        next_token: Optional pagination token for getting more results
-    
-    Returns:
-        JSON string containing daily sleep data
-    """
-    try:
-        sleep = oura_api.get_daily_sleep(start_date, end_date, next_token)
-        return str(sleep)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+def _timeout_error(e: httpx.TimeoutException) -> str:
+    """Describe a timed-out API request as JSON."""
+    return orjson.dumps({"error": "timeout", "type": type(e).__name__}).decode()
 
 
-@mcp.tool()
-def get_oura_daily_spo2(
-    start_date: str,
-    end_date: str,
-    next_token: Optional[str] = None
-) -> str:
-    """
-    Get Oura Ring daily SpO2 data for a specific date range.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format  
-        next_token: Optional pagination token for getting more results
-    
-    Returns:
-        JSON string containing daily SpO2 data
-    """
-    try:
-        spo2 = oura_api.get_daily_spo2(start_date, end_date, next_token)
-        return str(spo2)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+def _exception_error(e: Exception) -> str:
+    """Describe an unexpected exception as JSON."""
+    return orjson.dumps({"error": type(e).__name__, "message": str(e)}).decode()
 
 
+# Tools
 @mcp.tool()
-def get_oura_daily_readiness(
-    start_date: str,
-    end_date: str,
-    next_token: Optional[str] = None
-) -> str:
+async def get_oura_personal_info() -> str:
     """
-    Get Oura Ring daily readiness data for a specific date range.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format  
-        next_token: Optional pagination token for getting more results
+    Get personal info from Oura Ring.
     
     Returns:
-        JSON string containing daily readiness data
+        JSON string containing personal information
     """
     try:
-        readiness = oura_api.get_daily_readiness(start_date, end_date, next_token)
-        return str(readiness)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
+        info = await oura_api.get_personal_info()
+        return orjson.dumps(info).decode()
+    except httpx.HTTPStatusError as e:
+        return _http_error(e)
+    except httpx.TimeoutException as e:
+        return _timeout_error(e)
     except Exception as e:
-        return f"Error: {str(e)}"
+        return _exception_error(e)
 
 
-@mcp.tool()
-def get_oura_sleep(
-    start_date: str,
-    end_date: str,
-    next_token: Optional[str] = None
-) -> str:
-    """
-    Get Oura Ring sleep data for a specific date range.
+DATE_RANGE_TOOL_DOC = """
+    Get Oura Ring {description} for a specific date range.
     
     Args:
         start_date: Start date in YYYY-MM-DD format
@@ -321,102 +508,135 @@ def get_oura_sleep(
         next_token: Optional pagination token for getting more results
     
     Returns:
-        JSON string containing sleep data
+        JSON string containing {description}
     """
-    try:
-        sleep = oura_api.get_sleep(start_date, end_date, next_token)
-        return str(sleep)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
-    except Exception as e:
-        return f"Error: {str(e)}"
 
 
-@mcp.tool()
-def get_oura_sleep_time(
+def _make_tool(endpoint: int, name: str, description: str) -> Callable[..., Awaitable[str]]:
+    """Build a date-range tool for an ENDPOINTS index."""
+    async def tool(
+        start_date: str,
+        end_date: str,
+        next_token: Optional[str] = None
+    ) -> str:
+        if not (DATE_RE.fullmatch(start_date) and DATE_RE.fullmatch(end_date)):
+            return INVALID_DATE_ERROR
+        try:
+            data = await oura_api.fetch(endpoint, start_date, end_date, next_token)
+            return orjson.dumps(data).decode()
+        except httpx.HTTPStatusError as e:
+            return _http_error(e)
+        except httpx.TimeoutException as e:
+            return _timeout_error(e)
+        except Exception as e:
+            return _exception_error(e)
+    
+    # FastMCP derives the tool schema and description from these
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = DATE_RANGE_TOOL_DOC.format(description=description)
+    return tool
+
+
+DATE_RANGE_TOOLS = [
+    ("get_oura_sessions", SESSION, "session data"),
+    ("get_oura_daily_activity", DAILY_ACTIVITY, "daily activity data"),
+    ("get_oura_daily_sleep", DAILY_SLEEP, "daily sleep data"),
+    ("get_oura_daily_spo2", DAILY_SPO2, "daily SpO2 data"),
+    ("get_oura_daily_readiness", DAILY_READINESS, "daily readiness data"),
+    ("get_oura_sleep", SLEEP, "sleep data"),
+    ("get_oura_sleep_time", SLEEP_TIME, "sleep time data"),
+    ("get_oura_workout", WORKOUT, "workout data"),
+    ("get_oura_enhanced_tag", ENHANCED_TAG, "enhanced tag data"),
+]
+
+def _register_date_range_tools() -> None:
+    """Register a tool for every entry in DATE_RANGE_TOOLS."""
+    for name, endpoint, description in DATE_RANGE_TOOLS:
+        mcp.tool(name=name)(_make_tool(endpoint, name, description))
+
+
+_register_date_range_tools()
+
+
+@mcp.tool(structured_output=False)
+async def get_oura_records_jsonl(
+    endpoint: RecordEndpoint,
     start_date: str,
     end_date: str,
-    next_token: Optional[str] = None
-) -> str:
+    ctx: Context
+) -> list[TextContent]:
     """
-    Get Oura Ring sleep time data for a specific date range.
+    Get every Oura Ring record of one endpoint for a date range as JSON Lines.
     
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format  
-        next_token: Optional pagination token for getting more results
-    
-    Returns:
-        JSON string containing sleep time data
-    """
-    try:
-        sleep_time = oura_api.get_sleep_time(start_date, end_date, next_token)
-        return str(sleep_time)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool()
-def get_oura_workout(
-    start_date: str,
-    end_date: str,
-    next_token: Optional[str] = None
-) -> str:
-    """
-    Get Oura Ring workout data for a specific date range.
+    Pagination is followed automatically. Records are parsed as they arrive
+    and returned in blocks of one JSON object per line, with progress reported
+    after each block, which suits ranges spanning weeks or months.
     
     Args:
+        endpoint: One of session, daily_activity, daily_sleep, daily_spo2,
+            daily_readiness, sleep, sleep_time, workout, enhanced_tag
         start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format  
-        next_token: Optional pagination token for getting more results
+        end_date: End date in YYYY-MM-DD format
     
     Returns:
-        JSON string containing workout data
+        Text blocks of newline-delimited JSON records
     """
+    if not (DATE_RE.fullmatch(start_date) and DATE_RE.fullmatch(end_date)):
+        return [TextContent(type="text", text=INVALID_DATE_ERROR)]
+    
+    blocks = []
+    batch = []
+    count = 0
+    
+    async def flush() -> None:
+        nonlocal count
+        blocks.append(TextContent(type="text", text=b"\n".join(batch).decode()))
+        count += len(batch)
+        batch.clear()
+        await ctx.report_progress(count, message=f"{count} records")
+    
+    # Errors mid-range keep the records already parsed and append the error
+    error = None
     try:
-        workout = oura_api.get_workout(start_date, end_date, next_token)
-        return str(workout)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
+        async for record in oura_api.iter_records(RECORD_ENDPOINTS[endpoint], start_date, end_date):
+            batch.append(orjson.dumps(record))
+            if len(batch) == JSONL_BATCH_SIZE:
+                await flush()
+    except httpx.HTTPStatusError as e:
+        error = _http_error(e)
+    except httpx.TimeoutException as e:
+        error = _timeout_error(e)
     except Exception as e:
-        return f"Error: {str(e)}"
+        error = _exception_error(e)
+    
+    if batch:
+        await flush()
+    if error is not None:
+        blocks.append(TextContent(type="text", text=error))
+    return blocks
 
 
-@mcp.tool()
-def get_oura_enhanced_tag(
-    start_date: str,
-    end_date: str,
-    next_token: Optional[str] = None
-) -> str:
-    """
-    Get Oura Ring enhanced tag data for a specific date range.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format  
-        next_token: Optional pagination token for getting more results
-    
-    Returns:
-        JSON string containing enhanced tag data
-    """
+async def _serve() -> None:
+    """Serve over stdio and shut down shared state when the server exits."""
     try:
-        tags = oura_api.get_enhanced_tag(start_date, end_date, next_token)
-        return str(tags)
-    except requests.exceptions.HTTPError as e:
-        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+        await mcp.run_stdio_async()
+    finally:
+        await _shutdown()
 
 
 def main():
     """Run the MCP server."""
     import sys
     print("Starting Oura Ring MCP Server...", file=sys.stderr)
-    print("Tools: get_oura_personal_info, get_oura_sessions, get_oura_daily_activity, get_oura_daily_sleep, get_oura_daily_spo2, get_oura_daily_readiness, get_oura_sleep, get_oura_sleep_time, get_oura_workout, get_oura_enhanced_tag", file=sys.stderr)
-    print("Resources: oura://personal_info, oura://sessions/recent, oura://activity/recent, oura://sleep/recent, oura://readiness/recent", file=sys.stderr)
-    mcp.run()
+    print("Tools: get_oura_personal_info, get_oura_sessions, get_oura_daily_activity, get_oura_daily_sleep, get_oura_daily_spo2, get_oura_daily_readiness, get_oura_sleep, get_oura_sleep_time, get_oura_workout, get_oura_enhanced_tag, get_oura_records_jsonl", file=sys.stderr)
+    print("Resources: oura://personal_info, oura://sessions/recent, oura://activity/recent, oura://sleep/recent, oura://readiness/recent, oura://recent", file=sys.stderr)
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is unavailable on Windows; use the default event loop
+        asyncio.run(_serve())
+    else:
+        asyncio.run(_serve(), loop_factory=uvloop.new_event_loop)
 
 
 if __name__ == "__main__":
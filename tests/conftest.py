@@ -0,0 +1,38 @@
+"""Shared fixtures for the Oura Ring MCP Server tests."""
+
+import os
+
+# server.py refuses to import without a token
+os.environ.setdefault("OURA_ACCESS_TOKEN", "test-token")
+
+import httpx
+import pytest
+
+from oura_mcp_server import server
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def make_api(monkeypatch):
+    """Install an OuraRingAPI backed by a MockTransport as the server's client.
+
+    Returns a factory taking the request handler; every request it sees is
+    recorded in the returned client's ``requests`` list.
+    """
+    def factory(handler):
+        requests = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        api = server.OuraRingAPI("test-token", transport=httpx.MockTransport(record))
+        api.requests = requests
+        monkeypatch.setattr(server, "oura_api", api)
+        return api
+
+    return factory
@@ -0,0 +1,340 @@
+"""Tests for the Oura Ring MCP Server."""
+
+import asyncio
+from contextlib import suppress
+
+import httpx
+import orjson
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from oura_mcp_server import server
+
+
+def page(data, next_token=None):
+    """Build an Oura API response page."""
+    return httpx.Response(200, json={"data": data, "next_token": next_token})
+
+
+@pytest.fixture(autouse=True)
+def no_refresher(monkeypatch):
+    """Give each test a fresh process-wide refresher slot."""
+    monkeypatch.setattr(server, "_refresher", None)
+
+
+@pytest.mark.anyio
+async def test_client_survives_session_lifespan(make_api):
+    api = make_api(lambda request: page([{"day": "2024-01-01"}]))
+
+    # SSE and streamable HTTP enter the lifespan once per connection
+    async with server.lifespan(server.mcp):
+        pass
+    async with server.lifespan(server.mcp):
+        data = await server.oura_api.get_sleep("2024-01-01", "2024-01-02")
+
+    assert data["data"] == [{"day": "2024-01-01"}]
+    assert not api._client.is_closed
+
+
+@pytest.mark.anyio
+async def test_sessions_share_one_refresher(make_api):
+    api = make_api(lambda request: page([]))
+
+    async with server.lifespan(server.mcp):
+        refresher = server._refresher
+        async with server.lifespan(server.mcp):
+            assert server._refresher is refresher
+        await asyncio.sleep(0.05)
+
+    # One refresh of the four recent endpoints, not one per session
+    assert len(api.requests) == len(server.RECENT_ENDPOINTS)
+    assert not refresher.done()
+
+    await server._shutdown()
+
+    assert refresher.cancelled()
+    assert api._client.is_closed
+
+
+@pytest.mark.parametrize(
+    ("headers", "attempt", "expected"),
+    [
+        ({}, 0, server.BACKOFF_FACTOR),
+        ({}, 2, server.BACKOFF_FACTOR * 4),
+        ({"Retry-After": "5"}, 0, 5.0),
+        ({"Retry-After": "3600"}, 0, server.RETRY_AFTER_CAP),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0, 0.0),
+        ({"Retry-After": "soon"}, 1, server.BACKOFF_FACTOR * 2),
+    ],
+)
+def test_retry_delay(headers, attempt, expected):
+    response = httpx.Response(429, headers=headers)
+    assert server._retry_delay(response, attempt) == expected
+
+
+@pytest.mark.anyio
+async def test_get_honours_retry_after(make_api, monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(server.asyncio, "sleep", sleep)
+    responses = iter([httpx.Response(429, headers={"Retry-After": "7"}), page([])])
+    api = make_api(lambda request: next(responses))
+
+    data = await api.get_workout("2024-01-01", "2024-01-02")
+
+    assert data["data"] == []
+    assert delays == [7.0]
+    assert len(api.requests) == 2
+
+
+def paginated(request):
+    """Serve two pages per range: the first links to the second via next_token."""
+    token = request.url.params.get("next_token")
+    return page([{"page": token}], None if token else "t2")
+
+
+@pytest.mark.anyio
+async def test_next_page_served_from_prefetch(make_api):
+    api = make_api(paginated)
+
+    first = await api.fetch(server.SLEEP, "2024-01-01", "2024-02-01")
+    second = await api.fetch(server.SLEEP, "2024-01-01", "2024-02-01", first["next_token"])
+
+    assert second["data"] == [{"page": "t2"}]
+    assert [r.url.params.get("next_token") for r in api.requests] == [None, "t2"]
+
+
+@pytest.mark.anyio
+async def test_cancelling_caller_does_not_refetch_prefetched_page(make_api):
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.url.params.get("next_token"):
+            await release.wait()
+        return paginated(request)
+
+    api = make_api(handler)
+    await api.fetch(server.SLEEP, "2024-01-01", "2024-02-01")
+
+    caller = asyncio.create_task(api.fetch(server.SLEEP, "2024-01-01", "2024-02-01", "t2"))
+    await asyncio.sleep(0)
+    caller.cancel()
+    # A refetch would block on the held request instead of finishing
+    async with asyncio.timeout(1):
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+    # The prefetch survives the cancellation and serves the next request
+    release.set()
+    async with asyncio.timeout(1):
+        second = await api.fetch(server.SLEEP, "2024-01-01", "2024-02-01", "t2")
+
+    assert second["data"] == [{"page": "t2"}]
+    assert [r.url.params.get("next_token") for r in api.requests] == [None, "t2"]
+
+
+@pytest.mark.anyio
+async def test_evicted_prefetch_is_refetched(make_api):
+    api = make_api(paginated)
+    await api.fetch(server.SLEEP, "2024-01-01", "2024-02-01")
+    for task in api._prefetch.values():
+        task.cancel()
+
+    second = await api.fetch(server.SLEEP, "2024-01-01", "2024-02-01", "t2")
+
+    assert second["data"] == [{"page": "t2"}]
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    """Deliver a body in small chunks so records straddle chunk boundaries."""
+
+    def __init__(self, body: bytes, size: int = 7):
+        self.body = body
+        self.size = size
+
+    async def __aiter__(self):
+        for start in range(0, len(self.body), self.size):
+            yield self.body[start:start + self.size]
+
+
+def streamed_page(data, next_token=None):
+    """Build an Oura API response page delivered as a chunked stream."""
+    body = orjson.dumps({"data": data, "next_token": next_token})
+    return httpx.Response(200, stream=ChunkedStream(body))
+
+
+def readiness_pages(request):
+    """Serve two streamed pages of readiness records with float fields."""
+    token = request.url.params.get("next_token")
+    if token is None:
+        records = [{"day": "2024-01-01", "temperature_deviation": -0.12, "contributors": {"hrv_balance": 81}}]
+        return streamed_page(records, "p2")
+    records = [{"day": "2024-01-02", "temperature_deviation": 0.5, "contributors": {"hrv_balance": 77}}]
+    return streamed_page(records)
+
+
+@pytest.mark.anyio
+async def test_iter_records_follows_pagination_with_plain_floats(make_api):
+    api = make_api(readiness_pages)
+
+    records = [record async for record in api.iter_records(server.DAILY_READINESS, "2024-01-01", "2024-01-03")]
+
+    assert records == [
+        {"day": "2024-01-01", "temperature_deviation": -0.12, "contributors": {"hrv_balance": 81}},
+        {"day": "2024-01-02", "temperature_deviation": 0.5, "contributors": {"hrv_balance": 77}},
+    ]
+    assert type(records[0]["temperature_deviation"]) is float
+    assert [r.url.params.get("next_token") for r in api.requests] == [None, "p2"]
+
+
+@pytest.mark.anyio
+async def test_iter_records_retries_rate_limited_pages(make_api):
+    responses = iter([
+        streamed_page([{"id": 1}], "p2"),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        streamed_page([{"id": 2}]),
+    ])
+    api = make_api(lambda request: next(responses))
+
+    records = [record async for record in api.iter_records(server.SLEEP, "2024-01-01", "2024-03-01")]
+
+    assert records == [{"id": 1}, {"id": 2}]
+    assert [r.url.params.get("next_token") for r in api.requests] == [None, "p2", "p2"]
+
+
+@pytest.mark.anyio
+async def test_iter_records_raises_with_readable_error_body(make_api):
+    api = make_api(lambda request: httpx.Response(401, json={"detail": "invalid token"}))
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        [record async for record in api.iter_records(server.SLEEP, "2024-01-01", "2024-01-02")]
+
+    assert excinfo.value.response.json() == {"detail": "invalid token"}
+
+
+@pytest.mark.anyio
+async def test_date_range_tools_publish_schema_and_docstring():
+    tools = {tool.name: tool for tool in await server.mcp.list_tools()}
+
+    for name, _, description in server.DATE_RANGE_TOOLS:
+        tool = tools[name]
+        assert tool.inputSchema["required"] == ["start_date", "end_date"]
+        assert set(tool.inputSchema["properties"]) == {"start_date", "end_date", "next_token"}
+        assert f"Get Oura Ring {description} for a specific date range." in tool.description
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(("name", "endpoint", "description"), server.DATE_RANGE_TOOLS)
+async def test_date_range_tools_dispatch_to_their_endpoint(make_api, name, endpoint, description):
+    api = make_api(lambda request: page([{"day": "2024-01-01", "score": 0.5}]))
+
+    content, _ = await server.mcp.call_tool(
+        name, {"start_date": "2024-01-01", "end_date": "2024-01-07", "next_token": "abc"}
+    )
+
+    assert orjson.loads(content[0].text) == {"data": [{"day": "2024-01-01", "score": 0.5}], "next_token": None}
+    (request,) = api.requests
+    assert request.url.path == f"/v2/usercollection/{server.ENDPOINTS[endpoint]}"
+    assert dict(request.url.params) == {"start_date": "2024-01-01", "end_date": "2024-01-07", "next_token": "abc"}
+
+
+@pytest.mark.anyio
+async def test_date_range_tools_reject_malformed_dates(make_api):
+    api = make_api(lambda request: page([]))
+
+    content, _ = await server.mcp.call_tool("get_oura_sleep", {"start_date": "2024-1-1", "end_date": "2024-01-07"})
+
+    assert content[0].text == server.INVALID_DATE_ERROR
+    assert api.requests == []
+
+
+@pytest.fixture
+async def client_session(monkeypatch):
+    """Connect an MCP client to the server over in-memory streams."""
+    # Keep the session's refresher off the mocked API
+    monkeypatch.setattr(server, "RECENT_ENDPOINTS", ())
+    async with create_connected_server_and_client_session(server.mcp._mcp_server) as session:
+        yield session
+    server._refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await server._refresher
+
+
+def readiness_records(first, count):
+    """Build readiness records with float fields, numbered from first."""
+    return [{"id": i, "temperature_deviation": i / 10, "contributors": {"hrv_balance": 80}} for i in range(first, first + count)]
+
+
+async def call_jsonl_tool(session, endpoint="daily_readiness"):
+    """Call the JSON Lines tool and collect its text blocks and progress reports."""
+    progress = []
+
+    async def on_progress(value, total, message):
+        progress.append((value, message))
+
+    result = await session.call_tool(
+        "get_oura_records_jsonl",
+        {"endpoint": endpoint, "start_date": "2024-01-01", "end_date": "2024-03-01"},
+        progress_callback=on_progress,
+    )
+    return [block.text for block in result.content], progress
+
+
+@pytest.mark.anyio
+async def test_records_jsonl_tool_publishes_endpoint_enum():
+    tools = {tool.name: tool for tool in await server.mcp.list_tools()}
+
+    schema = tools["get_oura_records_jsonl"].inputSchema
+    assert schema["properties"]["endpoint"]["enum"] == list(server.RECORD_ENDPOINTS)
+    assert "personal_info" not in server.RECORD_ENDPOINTS
+
+
+@pytest.mark.anyio
+async def test_records_jsonl_tool_batches_two_page_range(make_api, client_session):
+    def handler(request):
+        if request.url.params.get("next_token") is None:
+            return streamed_page(readiness_records(0, 20), "p2")
+        return streamed_page(readiness_records(20, 10))
+
+    api = make_api(handler)
+
+    blocks, progress = await call_jsonl_tool(client_session)
+
+    lines = [line.split("\n") for line in blocks]
+    assert [len(block) for block in lines] == [16, 14]
+    assert [orjson.loads(line) for block in lines for line in block] == readiness_records(0, 30)
+    assert progress == [(16, "16 records"), (30, "30 records")]
+    assert [r.url.path for r in api.requests] == ["/v2/usercollection/daily_readiness"] * 2
+
+
+@pytest.mark.anyio
+async def test_records_jsonl_tool_appends_error_after_partial_range(make_api, client_session):
+    def handler(request):
+        if request.url.params.get("next_token") is None:
+            return streamed_page(readiness_records(0, 20), "p2")
+        return httpx.Response(401, json={"detail": "invalid token"})
+
+    make_api(handler)
+
+    blocks, progress = await call_jsonl_tool(client_session)
+
+    # Records parsed before the failure are kept, then the error block follows
+    assert [orjson.loads(line) for block in blocks[:2] for line in block.split("\n")] == readiness_records(0, 20)
+    assert progress == [(16, "16 records"), (20, "20 records")]
+    assert orjson.loads(blocks[2]) == {"error": "http", "status": 401, "body": '{"detail":"invalid token"}'}
+
+
+@pytest.mark.anyio
+async def test_records_jsonl_tool_rejects_unknown_endpoint(make_api, client_session):
+    api = make_api(lambda request: page([]))
+
+    result = await client_session.call_tool(
+        "get_oura_records_jsonl",
+        {"endpoint": "personal_info", "start_date": "2024-01-01", "end_date": "2024-01-07"},
+    )
+
+    assert result.isError
+    assert api.requests == []